@@ -0,0 +1,44 @@
+"""Compatibility helpers - Interpreter feature switches and optional dependencies.
+
+Optional packages are imported once here; modules that can use them import the
+name from this module and check it against None.
+"""
+
+import sys
+from types import ModuleType
+from typing import Any, Optional, Tuple
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class ViewCacheSlot:
+    """Base for dataclasses that cache a derived view outside their fields.
+
+    The slot is not a dataclass field, so it stays out of ``fields()``,
+    ``asdict()``, ``repr`` and comparisons. Subclasses set it in
+    ``__post_init__``.
+    """
+
+    __slots__ = ("_view_cache",)
+
+    _view_cache: Optional[Tuple[Any, ...]]
+
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional codec
+    msgpack = None
+
+
+def require_msgpack() -> Any:
+    """Return the msgpack module, or raise ImportError naming the extra that provides it."""
+    if msgpack is None:
+        raise ImportError("msgpack is required for this codec: pip install lexecon-core[msgpack]")
+    return msgpack
@@ -11,15 +11,16 @@ For enterprise features (evidence export, verification, multi-tenancy):
 
 import time
 import uuid
-from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
+from lexecon_core._compat import orjson
 from lexecon_core.policy.engine import PolicyEngine, PolicyMode
-from lexecon_core.ledger.chain import LedgerChain
+from lexecon_core.ledger.chain import LedgerChain, utc_now_iso
+from lexecon_core.ledger.writeback import WriteBackStorage
 
 
 # Pydantic models
@@ -61,18 +62,33 @@ startup_time: float = time.time()
 
 
 def initialize():
-    """Initialize the policy engine."""
+    """Initialize the policy engine with the sample policy, once."""
     global policy_engine
-    if policy_engine is None:
-        policy_engine = PolicyEngine(mode=PolicyMode.STRICT)
-    
+    if policy_engine is not None:
+        return
+
     # Add a sample policy
     from lexecon_core.policy.terms import PolicyTerm
     from lexecon_core.policy.relations import PolicyRelation
-    
-    actor = PolicyTerm.actor("ai_agent:default")
-    action = PolicyTerm.action("access_data")
-    policy_engine.add_relation(PolicyRelation.permits(actor, action))
+
+    engine = PolicyEngine(mode=PolicyMode.STRICT)
+    actor = PolicyTerm.create_actor("ai_agent:default", "Default AI agent")
+    action = PolicyTerm.create_action("access_data", "Access data")
+    engine.add_term(actor)
+    engine.add_term(action)
+    engine.add_relation(PolicyRelation.permits(actor.term_id, action.term_id))
+    policy_engine = engine
+
+
+def configure_ledger(storage) -> LedgerChain:
+    """Persist decisions to ``storage`` without blocking request handlers.
+
+    Appends stay in memory on the request path; writes are queued through
+    WriteBackStorage and drained in batches, and flushed on shutdown.
+    """
+    global ledger
+    ledger = LedgerChain(storage=WriteBackStorage(storage))
+    return ledger
 
 
 @app.on_event("startup")
@@ -80,6 +96,12 @@ async def startup():
     initialize()
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    if isinstance(ledger.storage, WriteBackStorage):
+        ledger.storage.close()
+
+
 @app.get("/health")
 async def health():
     """Health check."""
@@ -87,7 +109,7 @@ async def health():
         "status": "healthy",
         "version": "0.1.0",
         "node_id": node_id,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
 
@@ -127,7 +149,7 @@ async def decide(request: DecisionRequestModel):
         decision_id=decision_id,
         decision=decision,
         reason=result.reason,
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=utc_now_iso(),
     )
 
 
@@ -140,19 +162,32 @@ async def list_entries(
     
     For chain verification and evidence export, see enterprise distribution.
     """
-    entries = ledger.entries
-    
-    if event_type:
-        entries = [e for e in entries if e.event_type == event_type]
-    
-    if limit:
-        entries = entries[-limit:]
+    if event_type and limit and limit > 0:
+        # Scan back from the tail instead of filtering the whole chain; the
+        # scan already stops at the last ``limit`` matches
+        entries = ledger.get_entries_by_type(event_type, limit=limit)
+    else:
+        entries = ledger.entries
+        if event_type:
+            entries = ledger.get_entries_by_type(event_type)
+        if limit:
+            entries = entries[-limit:]
     
-    return {
+    payload = {
         "entries": [e.to_dict() for e in entries],
         "total": len(ledger.entries),
         "note": "Core edition - basic ledger only",
     }
+    if orjson is not None:
+        # Entry data is already JSON-shaped; serializing it directly skips
+        # FastAPI's jsonable_encoder walk over every entry.
+        try:
+            body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            return Response(body, media_type="application/json")
+    return payload
 
 
 @app.get("/")
@@ -165,3 +200,11 @@ async def root():
         "endpoints": ["/health", "/decide", "/ledger/entries"],
         "enterprise": "https://lexecon.ai/enterprise",
     }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvicorn picks uvloop and httptools automatically when installed (the
+    # "server" extra pulls them in via uvicorn[standard]).
+    uvicorn.run(app, host="127.0.0.1", port=8000)
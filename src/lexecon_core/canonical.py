@@ -0,0 +1,82 @@
+"""Canonical JSON - Deterministic serialization for hashing.
+
+Ledger entry hashes and policy version hashes are computed over sorted-key,
+compact, ASCII-escaped JSON. orjson is used when installed, but only when its
+output is guaranteed to match the stdlib encoding byte for byte, so hashes do
+not depend on which serializer is available.
+"""
+
+import json
+import re
+import uuid
+from enum import Enum
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+from lexecon_core._compat import orjson
+
+
+def _default(obj: Any) -> Any:
+    """Encode the non-JSON types orjson serializes natively, the same way it does."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_stdlib_encode = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=_default).encode
+
+# Folds every digit to "0", so a digit followed by an exponent is a substring test.
+_FOLD_DIGITS = bytes.maketrans(b"123456789", b"000000000")
+
+# A plain decimal below 1e-4, which the stdlib writes with an exponent. Only
+# run when the raw bytes contain "0.0000", which also matches e.g. 1.00001.
+_SMALL_DECIMAL = re.compile(rb"(?<![0-9])0\.0000").search
+
+if orjson is not None:
+    # Dataclasses, datetimes and subclasses of builtin types are sent back to
+    # the stdlib, which decides how (or whether) to encode them.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def _matches_stdlib(encoded: bytes) -> bool:
+    """Check that orjson output cannot differ from the stdlib encoding.
+
+    The serializers disagree on non-ASCII text and DEL (the stdlib escapes both),
+    on NaN/Infinity and on floats the stdlib writes with an exponent (orjson
+    writes ``1e16`` and ``0.00001`` for ``1e+16`` and ``1e-05``). orjson writes
+    NaN and Infinity as ``null``, which cannot be told apart from None, so any
+    ``null`` in the output (None included) forces the stdlib fallback. Strings
+    that merely look like these forms only cost a fallback.
+    """
+    if not encoded.isascii() or b"\x7f" in encoded or b"null" in encoded:
+        return False
+    if b"0.0000" in encoded and _SMALL_DECIMAL(encoded):
+        return False
+    return b"0e" not in encoded.translate(_FOLD_DIGITS)
+
+
+def canonical_json(obj: Any) -> bytes:
+    """Serialize ``obj`` to canonical JSON bytes.
+
+    Equivalent to ``json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()``,
+    except that enum members are encoded as their value and UUIDs as their
+    string form (as orjson does), whichever serializer handles the call.
+    """
+    if type(obj) is str:
+        return encode_basestring_ascii(obj).encode()
+    if orjson is not None:
+        try:
+            encoded: bytes = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+        else:
+            if _matches_stdlib(encoded):
+                return encoded
+    return _stdlib_encode(obj).encode()
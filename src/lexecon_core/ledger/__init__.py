@@ -1,8 +1,9 @@
 """Ledger module for Lexecon."""
 
-from lexecon.ledger.chain import LedgerChain, LedgerEntry
+from lexecon_core.ledger.chain import LedgerChain, LedgerEntry
+from lexecon_core.ledger.writeback import WriteBackStorage
 
 # Alias for backwards compatibility and convenience
 Ledger = LedgerChain
 
-__all__ = ["Ledger", "LedgerChain", "LedgerEntry"]
+__all__ = ["Ledger", "LedgerChain", "LedgerEntry", "WriteBackStorage"]
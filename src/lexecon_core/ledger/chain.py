@@ -4,15 +4,129 @@ Each entry is cryptographically linked to previous entries.
 """
 
 import hashlib
-import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from json.encoder import encode_basestring_ascii
 from typing import Any, Dict, List, Optional
 
+from lexecon_core.canonical import canonical_json
 
-@dataclass
+# hashlib is backed by OpenSSL, which uses the CPU's SHA extensions when present.
+_sha256 = hashlib.sha256
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") for the last second seen
+_iso_second = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time in the format of ``datetime.utcnow().isoformat()``.
+
+    The date/time prefix is formatted once per second and reused; only the
+    microseconds are formatted on every call.
+    """
+    global _iso_second
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _iso_second
+    if cached_seconds != seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _iso_second = (seconds, prefix)
+    micros = nanos // 1000
+    return f"{prefix}.{micros:06d}" if micros else prefix
+
+
+# Sorted top-level keys after "data", with the escaped string values slotted in
+_TAIL_FORMAT = ',"entry_id":%s,"event_type":%s,"previous_hash":%s,"timestamp":%s}'
+
+
+def _canonical_tail(entry_id: str, event_type: str, timestamp: str, previous_hash: str) -> bytes:
+    """Encode the scalar entry fields as the tail of the canonical JSON object.
+
+    The top-level keys are fixed, so they are framed in sorted order by hand
+    (``data`` sorts first and is encoded separately). The result is identical
+    to sorted-key canonical JSON without building a throwaway dict per entry.
+    """
+    try:
+        return (
+            _TAIL_FORMAT
+            % (
+                encode_basestring_ascii(entry_id),
+                encode_basestring_ascii(event_type),
+                encode_basestring_ascii(previous_hash),
+                encode_basestring_ascii(timestamp),
+            )
+        ).encode()
+    except TypeError:
+        # A field is not a string; let the full encoder handle (or reject) it.
+        return b"".join(
+            (
+                b',"entry_id":',
+                canonical_json(entry_id),
+                b',"event_type":',
+                canonical_json(event_type),
+                b',"previous_hash":',
+                canonical_json(previous_hash),
+                b',"timestamp":',
+                canonical_json(timestamp),
+                b"}",
+            )
+        )
+
+
+def _recompute_hashes(entries: List["LedgerEntry"]) -> List[str]:
+    """Recompute the hash of each entry from its live fields in a single pass.
+
+    Every field is re-encoded, so edits made behind the frozen dataclass (e.g.
+    through ``object.__setattr__``) are caught. Digesting the whole batch up
+    front keeps the per-entry work in one tight comprehension.
+    """
+    encode = canonical_json
+    tail = _canonical_tail
+    sha256 = _sha256
+    return [
+        sha256(
+            b'{"data":'
+            + encode(entry.data)
+            + tail(entry.entry_id, entry.event_type, entry.timestamp, entry.previous_hash)
+        ).hexdigest()
+        for entry in entries
+    ]
+
+
+# Entries hashed per task by ``verify_integrity(parallel=True)``
+_VERIFY_CHUNK_SIZE = 1024
+
+
+def _recompute_hashes_parallel(
+    entries: List["LedgerEntry"], max_workers: Optional[int] = None
+) -> List[str]:
+    """Recompute entry hashes in chunks on a thread pool.
+
+    hashlib only releases the GIL for inputs of roughly 2 KiB or more, and
+    canonical encoding always holds it, so this only pays off for ledgers
+    with large ``data`` payloads. Results are in entry order.
+    """
+    chunks = [
+        entries[start : start + _VERIFY_CHUNK_SIZE]
+        for start in range(0, len(entries), _VERIFY_CHUNK_SIZE)
+    ]
+    if len(chunks) < 2:
+        return _recompute_hashes(entries)
+
+    digests: List[str] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for chunk_digests in executor.map(_recompute_hashes, chunks):
+            digests.extend(chunk_digests)
+    return digests
+
+
+@dataclass(frozen=True)
 class LedgerEntry:
-    """A single entry in the ledger chain."""
+    """A single entry in the ledger chain.
+
+    Entries are frozen once created; ``data`` can still change in place.
+    """
 
     entry_id: str
     event_type: str
@@ -22,31 +136,39 @@ class LedgerEntry:
     entry_hash: str = field(init=False)
 
     def __post_init__(self):
-        """Calculate entry hash after initialization."""
-        self.entry_hash = self.calculate_hash()
+        """Calculate entry hash."""
+        object.__setattr__(self, "entry_hash", self.calculate_hash())
 
     def calculate_hash(self) -> str:
         """Calculate deterministic hash of this entry."""
-        entry_data = {
-            "entry_id": self.entry_id,
-            "event_type": self.event_type,
-            "data": self.data,
-            "timestamp": self.timestamp,
-            "previous_hash": self.previous_hash,
-        }
-        canonical_json = json.dumps(entry_data, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(canonical_json.encode()).hexdigest()
+        return _sha256(self.canonical_bytes()).hexdigest()
+
+    def canonical_bytes(self) -> bytes:
+        """Return the canonical JSON encoding that the entry hash is computed over."""
+        tail = _canonical_tail(self.entry_id, self.event_type, self.timestamp, self.previous_hash)
+        return b'{"data":' + canonical_json(self.data) + tail
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize entry to dictionary."""
-        return {
-            "entry_id": self.entry_id,
-            "event_type": self.event_type,
-            "data": self.data,
-            "timestamp": self.timestamp,
-            "previous_hash": self.previous_hash,
-            "entry_hash": self.entry_hash,
-        }
+        """Serialize entry to dictionary.
+
+        The entry is frozen, so the dictionary is built once; each call returns
+        a shallow copy of it, so edits to an exported entry never reach the
+        ledger's own view of it.
+        """
+        # Cached in the instance __dict__ rather than as a field, so it stays
+        # out of fields() and asdict()
+        entry_dict = self.__dict__.get("_dict")
+        if entry_dict is None:
+            entry_dict = {
+                "entry_id": self.entry_id,
+                "event_type": self.event_type,
+                "data": self.data,
+                "timestamp": self.timestamp,
+                "previous_hash": self.previous_hash,
+                "entry_hash": self.entry_hash,
+            }
+            object.__setattr__(self, "_dict", entry_dict)
+        return dict(entry_dict)
 
 
 class LedgerChain:
@@ -83,7 +205,7 @@ class LedgerChain:
             entry_id="genesis",
             event_type="genesis",
             data={"message": "Lexecon ledger initialized"},
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=utc_now_iso(),
             previous_hash="0" * 64,  # No previous hash
         )
         self.entries.append(genesis)
@@ -106,7 +228,7 @@ class LedgerChain:
             entry_id=entry_id,
             event_type=event_type,
             data=data,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=utc_now_iso(),
             previous_hash=previous_hash,
         )
 
@@ -118,9 +240,17 @@ class LedgerChain:
 
         return entry
 
-    def verify_integrity(self) -> Dict[str, Any]:
+    def verify_integrity(
+        self, parallel: bool = False, max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Verify the integrity of the entire chain.
 
+        Args:
+            parallel: Recompute entry hashes on a thread pool. Only worthwhile
+                for large ledgers whose entries carry large payloads.
+            max_workers: Thread count when ``parallel`` is set (default: the
+                ``ThreadPoolExecutor`` default).
+
         Returns verification result with details of any corruption.
         """
         if not self.entries:
@@ -132,23 +262,34 @@ class LedgerChain:
                 "chain_intact": False,
             }
 
-        for i, entry in enumerate(self.entries):
-            # Verify entry hash
-            expected_hash = entry.calculate_hash()
-            if entry.entry_hash != expected_hash:
-                return {
-                    "valid": False,
-                    "error": f"Hash mismatch at entry {i}",
-                    "entry_id": entry.entry_id,
-                    "entries_checked": i + 1,
-                    "entries_verified": i,
-                    "chain_intact": False,
-                }
-
-            # Verify chain linkage (skip genesis)
-            if i > 0:
-                previous_entry = self.entries[i - 1]
-                if entry.previous_hash != previous_entry.entry_hash:
+        # Work on a snapshot so the hash columns stay aligned even if entries
+        # are appended concurrently (e.g. by the API) while verification runs.
+        entries = list(self.entries)
+        if parallel:
+            digests = _recompute_hashes_parallel(entries, max_workers)
+        else:
+            digests = _recompute_hashes(entries)
+
+        # Compare whole columns at C level; only walk entry by entry to locate
+        # the first failure when something does not line up.
+        entry_hashes = [entry.entry_hash for entry in entries]
+        previous_hashes = [entry.previous_hash for entry in entries]
+        if digests != entry_hashes or previous_hashes[1:] != entry_hashes[:-1]:
+            previous_entry = None
+            for i, entry in enumerate(entries):
+                # Verify entry hash
+                if entry.entry_hash != digests[i]:
+                    return {
+                        "valid": False,
+                        "error": f"Hash mismatch at entry {i}",
+                        "entry_id": entry.entry_id,
+                        "entries_checked": i + 1,
+                        "entries_verified": i,
+                        "chain_intact": False,
+                    }
+
+                # Verify chain linkage (skip genesis)
+                if previous_entry is not None and entry.previous_hash != previous_entry.entry_hash:
                     return {
                         "valid": False,
                         "error": f"Chain break at entry {i}",
@@ -157,13 +298,14 @@ class LedgerChain:
                         "entries_verified": i,
                         "chain_intact": False,
                     }
+                previous_entry = entry
 
         return {
             "valid": True,
-            "entries_checked": len(self.entries),
-            "entries_verified": len(self.entries),
+            "entries_checked": len(entries),
+            "entries_verified": len(entries),
             "chain_intact": True,
-            "chain_head_hash": self.entries[-1].entry_hash,
+            "chain_head_hash": entry_hashes[-1],
         }
 
     def get_entry(self, entry_id_or_hash: str) -> Optional[LedgerEntry]:
@@ -173,9 +315,26 @@ class LedgerChain:
                 return entry
         return None
 
-    def get_entries_by_type(self, event_type: str) -> List[LedgerEntry]:
-        """Get all entries of a specific event type."""
-        return [e for e in self.entries if e.event_type == event_type]
+    def get_entries_by_type(
+        self, event_type: str, limit: Optional[int] = None
+    ) -> List[LedgerEntry]:
+        """Get all entries of a specific event type.
+
+        If ``limit`` is given, only the most recent ``limit`` matching entries are
+        returned; the chain is scanned from the end and stops once they are found.
+        """
+        if limit is None:
+            return [e for e in self.entries if e.event_type == event_type]
+
+        matching: List[LedgerEntry] = []
+        if limit > 0:
+            for entry in reversed(self.entries):
+                if entry.event_type == event_type:
+                    matching.append(entry)
+                    if len(matching) == limit:
+                        break
+            matching.reverse()
+        return matching
 
     def generate_audit_report(self) -> Dict[str, Any]:
         """Generate a comprehensive audit report."""
@@ -0,0 +1,171 @@
+"""Write-back storage - Batched, non-blocking persistence for the ledger.
+
+Wraps a ledger storage backend so that ``LedgerChain.append`` only enqueues the
+new entry; a background thread persists queued entries in batches.
+"""
+
+import atexit
+import threading
+from collections import deque
+from typing import Any, Deque, List, Optional, cast
+
+from lexecon_core.ledger.chain import LedgerEntry
+
+
+class WriteBackStorage:
+    """Queue ledger writes and persist them in batches on a background thread.
+
+    Wraps any storage exposing ``save_entry`` and ``load_all_entries``. If the
+    wrapped storage also provides ``save_entries(entries)``, each batch is
+    handed over in one call so the backend can commit it as a single write.
+
+    Entries are persisted in append order. If a write fails, the unwritten
+    entries go back to the head of the queue and are retried with exponential
+    backoff. The failure is raised once from the next ``flush`` or ``close``
+    call, even if a later retry got through; entries are never dropped. After
+    ``close``, leftover entries are retried on the calling thread by further
+    ``flush`` or ``close`` calls. If ``close`` is never called, it runs at
+    interpreter exit, so queued entries are not lost with the writer thread.
+    """
+
+    def __init__(
+        self,
+        storage: Any,
+        max_batch: int = 16,
+        retry_delay: float = 0.05,
+        max_retry_delay: float = 5.0,
+    ):
+        """Initialize write-back storage.
+
+        Args:
+            storage: Storage backend to persist entries to.
+            max_batch: Maximum number of entries handed to the backend at once.
+            retry_delay: Seconds to wait before the first retry of a failed write.
+            max_retry_delay: Upper bound for the doubling retry delay.
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.storage = storage
+        self.max_batch = max_batch
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._save_entries = getattr(storage, "save_entries", None)
+        self._queue: Deque[LedgerEntry] = deque()
+        self._pending = 0  # Entries queued or currently being written
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._stopped = False  # Background thread has exited
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="lexecon-ledger-writeback", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def load_all_entries(self) -> List[LedgerEntry]:
+        """Load entries from the wrapped storage once pending writes have landed."""
+        self.flush()
+        return cast(List[LedgerEntry], self.storage.load_all_entries())
+
+    def save_entry(self, entry: LedgerEntry) -> None:
+        """Queue an entry for persistence and return immediately."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("WriteBackStorage is closed")
+            self._queue.append(entry)
+            self._pending += 1
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Block until every queued entry has been persisted.
+
+        Raises the pending write error, if any, instead of waiting on retries.
+        """
+        with self._cond:
+            while self._pending and self._error is None and not self._stopped:
+                self._cond.wait()
+            self._raise_error()
+            stopped = self._stopped
+        if stopped:
+            self._drain()
+
+    def close(self) -> None:
+        """Persist remaining entries and stop the background thread."""
+        atexit.unregister(self.close)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        with self._cond:
+            self._raise_error()
+        self._drain()
+
+    def _raise_error(self) -> None:
+        """Raise the stored write error and clear it, so it is reported once."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _take_batch(self) -> List[LedgerEntry]:
+        count = min(self.max_batch, len(self._queue))
+        return [self._queue.popleft() for _ in range(count)]
+
+    def _write(self, batch: List[LedgerEntry]) -> None:
+        """Persist a batch, putting unwritten entries back at the queue head on failure."""
+        written = 0
+        try:
+            if self._save_entries is not None:
+                self._save_entries(batch)
+            else:
+                for entry in batch:
+                    self.storage.save_entry(entry)
+                    written += 1
+        except Exception:
+            with self._cond:
+                self._queue.extendleft(reversed(batch[written:]))
+                self._pending -= written
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._pending -= len(batch)
+            if not self._pending:
+                self._cond.notify_all()
+
+    def _drain(self) -> None:
+        """Write leftover entries on the calling thread once the writer has stopped."""
+        while True:
+            with self._cond:
+                if not self._queue:
+                    return
+                batch = self._take_batch()
+            self._write(batch)
+
+    def _run(self) -> None:
+        delay = 0.0
+        try:
+            while True:
+                with self._cond:
+                    while not self._queue and not self._closed:
+                        self._cond.wait()
+                    if not self._queue:
+                        return
+                    batch = self._take_batch()
+
+                try:
+                    self._write(batch)
+                except Exception as exc:
+                    with self._cond:
+                        self._error = exc
+                        self._cond.notify_all()
+                        if self._closed:
+                            return
+                        delay = min(delay * 2 or self.retry_delay, self.max_retry_delay)
+                        self._cond.wait_for(lambda: self._closed, delay)
+                else:
+                    # A retry got through; the failure stays stored until
+                    # flush or close reports it.
+                    delay = 0.0
+        finally:
+            with self._cond:
+                self._stopped = True
+                self._cond.notify_all()
@@ -4,48 +4,109 @@ The engine loads terms and relations, and evaluates decision requests against th
 """
 
 import hashlib
-import json
+import weakref
+from bisect import bisect_right
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache, partial
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
 
-from lexecon.policy.relations import PolicyRelation, RelationType
-from lexecon.policy.terms import PolicyTerm
+from lexecon_core._compat import DATACLASS_SLOTS
+from lexecon_core.canonical import canonical_json
+from lexecon_core.policy.relations import NO_TYPE_CODE, PolicyRelation, RelationStore, RelationType
+from lexecon_core.policy.terms import PolicyTerm
 
 
-class PolicyDecision:
-    """Represents a policy evaluation decision."""
+_DECISION_KEYS = frozenset(
+    (
+        "allowed",
+        "reason",
+        "mode",
+        "permits_count",
+        "forbids_count",
+        "policy_version",
+        "policy_version_hash",
+        "permitted",
+        "reasoning",
+    )
+)
 
-    def __init__(self, allowed: bool, reason: str, **kwargs):
-        self.allowed = allowed
-        self.reason = reason
-        self.permitted = allowed  # Backwards compatibility
-        self.reasoning = reason  # Backwards compatibility
-        self._extra = kwargs
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+
+class _PolicyStamp:
+    """Slot for a decision's policy hash, kept out of the dataclass fields."""
+
+    __slots__ = ("_policy",)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class PolicyDecision(_PolicyStamp):
+    """Represents a policy evaluation decision.
+
+    Decisions are stamped with the integer ``policy_version`` they were made
+    against; the SHA-256 ``policy_version_hash`` is only computed when read.
+    """
+
+    allowed: bool
+    reason: str
+    mode: str = ""
+    permits_count: int = 0
+    forbids_count: int = 0
+    policy_version: int = 0
+
+    @property
+    def policy_version_hash(self) -> str:
+        """Deterministic hash of the policy version this decision was made against."""
+        policy: Optional[_PolicyHash] = getattr(self, "_policy", None)
+        if policy is None:
+            return ""
+        return policy.hexdigest()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        fields = (
+            self.allowed,
+            self.reason,
+            self.mode,
+            self.permits_count,
+            self.forbids_count,
+            self.policy_version,
+        )
+        return (_restore_decision, (fields, getattr(self, "_policy", None)))
+
+    @property
+    def permitted(self) -> bool:
+        """Backwards compatible alias for ``allowed``."""
+        return self.allowed
+
+    @property
+    def reasoning(self) -> str:
+        """Backwards compatible alias for ``reason``."""
+        return self.reason
 
     def __getitem__(self, key: str):
         """Support dictionary-style access for backwards compatibility."""
-        if key == "permitted":
-            return self.permitted
-        if key == "allowed":
-            return self.allowed
-        if key == "reason":
-            return self.reason
-        if key == "reasoning":
-            return self.reasoning
-        if hasattr(self, key):
+        if key in _DECISION_KEYS:
             return getattr(self, key)
-        if key in self._extra:
-            return self._extra[key]
         raise KeyError(key)
 
     def get(self, key: str, default=None):
         """Support dict.get() for backwards compatibility."""
-        try:
-            return self[key]
-        except KeyError:
-            return default
+        if key in _DECISION_KEYS:
+            return getattr(self, key)
+        return default
+
+
+def _stamp(decision: PolicyDecision, policy: Optional["_PolicyHash"]) -> PolicyDecision:
+    """Attach the policy hash holder to a decision (it is frozen, so bypass __setattr__)."""
+    if policy is not None:
+        object.__setattr__(decision, "_policy", policy)
+    return decision
+
+
+def _restore_decision(fields: Tuple[Any, ...], policy: Optional["_PolicyHash"]) -> PolicyDecision:
+    """Rebuild a pickled or copied decision, including its policy hash."""
+    return _stamp(PolicyDecision(*fields), policy)
 
 
 class PolicyMode(Enum):
@@ -56,10 +117,304 @@ class PolicyMode(Enum):
     PARANOID = "paranoid"  # Deny high risk unless human confirmation
 
 
+def _term_matches(value: str, term_id: str, labels: Dict[str, str]) -> bool:
+    """Check if a value matches a term by ID, by label, or as a substring of the ID."""
+    # Exact match with term ID
+    if value == term_id:
+        return True
+
+    # Check if the value matches the term's label
+    if labels.get(term_id) == value:
+        return True
+
+    # Substring match for backwards compatibility (e.g., "model" in "actor:model")
+    return value in term_id
+
+
+# Upper bound on memoized request values per compiled policy; requests carry
+# arbitrary strings, so the memo is reset rather than allowed to grow unbounded.
+_MATCH_CACHE_SIZE = 4096
+
+# Joins endpoint term IDs for substring scanning; IDs never contain it in practice,
+# and policies where one does use the per-term path instead.
+_SEPARATOR = "\0"
+
+# Number of distinct requests whose decisions are kept per compiled policy.
+_DECISION_CACHE_SIZE = 4096
+
+# Stands in for a relation's metadata["object"] when it has none (None is a valid value).
+_NO_OBJECT = object()
+
+
+class _PolicyHash:
+    """Lazily computed SHA-256 of one policy version's canonical JSON.
+
+    Holds only the policy snapshot needed to compute the hash, which is dropped
+    once the hash is known. Decisions reference this rather than the compiled
+    policy, so they stay small; pickling or copying one resolves the hash and
+    carries just the string.
+    """
+
+    __slots__ = ("_mode", "_terms", "_relations", "_value")
+
+    def __init__(
+        self,
+        mode: PolicyMode,
+        terms: Tuple[PolicyTerm, ...],
+        relations: Tuple[PolicyRelation, ...],
+        value: Optional[str] = None,
+    ):
+        self._mode = mode
+        self._terms = terms
+        self._relations = relations
+        self._value = value
+
+    def hexdigest(self) -> str:
+        """Return the policy hash, computing it on first use."""
+        if self._value is None:
+            policy_dict = {
+                "mode": self._mode.value,
+                "terms": [term.to_dict() for term in self._terms],
+                "relations": [relation.to_dict() for relation in self._relations],
+            }
+            self._value = hashlib.sha256(canonical_json(policy_dict)).hexdigest()
+            self._terms, self._relations = (), ()
+        return self._value
+
+    def __reduce__(self):
+        return (_PolicyHash, (self._mode, (), (), self.hexdigest()))
+
+
+class _CompiledPolicy:
+    """Lookup tables and decision cache derived from one version of the policy graph.
+
+    Built lazily on the first evaluation after a mutation. Relations are indexed
+    by type code, then source, then target. Index entries carry the relation's
+    position in the policy so results can be returned in policy order, and its
+    ``metadata["object"]`` (read once here rather than per evaluation).
+
+    Which term IDs a request value matches (by ID, label or substring) is
+    resolved once per distinct value, with a single scan over all endpoint IDs,
+    and memoized, so lookups are dict probes rather than substring scans.
+    """
+
+    __slots__ = (
+        "version",
+        "mode",
+        "policy_hash",
+        "index",
+        "labels",
+        "term_ids",
+        "_haystack",
+        "_starts",
+        "_label_ids",
+        "_matches",
+        "decide",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        mode: PolicyMode,
+        terms: Dict[str, PolicyTerm],
+        relations: List[PolicyRelation],
+    ):
+        self.version = version
+        self.mode = mode
+        store = RelationStore(relations)
+        # Snapshot of the policy, so its hash can be computed on demand later
+        self.policy_hash = _PolicyHash(mode, tuple(terms.values()), store.relations)
+
+        self.index: List[Dict[str, Dict[str, List[Tuple[int, PolicyRelation, Any]]]]] = [
+            {} for _ in RelationType
+        ]
+        rows = zip(store.type_codes, store.sources, store.targets, store.relations)
+        for position, (code, source, target, relation) in enumerate(rows):
+            if code == NO_TYPE_CODE:
+                # Not a RelationType member, so no lookup by type can match it
+                continue
+            by_target = self.index[code].setdefault(source, {})
+            object_id = relation.metadata.get("object", _NO_OBJECT)
+            by_target.setdefault(target, []).append((position, relation, object_id))
+        self.labels = {term_id: term.label for term_id, term in terms.items()}
+        self.term_ids = tuple(dict.fromkeys(store.sources + store.targets))
+
+        # All endpoint IDs joined into one string, so substring matches for a
+        # new value are found with str.find over the whole set at once.
+        self._haystack: Optional[str] = None
+        self._starts: List[int] = []
+        if all(type(term_id) is str and _SEPARATOR not in term_id for term_id in self.term_ids):
+            offset = 0
+            for term_id in self.term_ids:
+                self._starts.append(offset)
+                offset += len(term_id) + 1
+            self._haystack = _SEPARATOR.join(self.term_ids)
+        self._label_ids: Dict[str, List[str]] = {}
+        for term_id in self.term_ids:
+            label = self.labels.get(term_id)
+            if label is not None:
+                self._label_ids.setdefault(label, []).append(term_id)
+
+        self._matches: Dict[str, FrozenSet[str]] = {}
+        # Decisions memoized per distinct request. The memo reaches this policy
+        # through a weak proxy, so it does not keep it alive in a cycle.
+        self.decide = lru_cache(maxsize=_DECISION_CACHE_SIZE)(
+            partial(_CompiledPolicy.evaluate, weakref.proxy(self))
+        )
+
+    def evaluate(
+        self, actor: str, action: str, data_classes: Sequence[str], mode: PolicyMode
+    ) -> PolicyDecision:
+        """Evaluate a decision request without consulting the decision cache."""
+        # Find relevant relations
+        permits = self.find_relations(RelationType.PERMITS, actor, action, data_classes)
+        forbids = self.find_relations(RelationType.FORBIDS, actor, action, data_classes)
+
+        # Evaluate based on mode
+        decision = _MODE_RULES.get(mode, _deny_unless_permitted)(permits, forbids)
+
+        reasoning = _generate_reasoning(decision, permits, forbids)
+        result = PolicyDecision(
+            allowed=decision,
+            reason=reasoning,
+            mode=mode.value,
+            permits_count=len(permits),
+            forbids_count=len(forbids),
+            policy_version=self.version,
+        )
+        return _stamp(result, self.policy_hash)
+
+    def find_relations(
+        self, relation_type: RelationType, actor: str, action: str, data_classes: Sequence[str]
+    ) -> List[PolicyRelation]:
+        """Return the relations of ``relation_type`` matching the request, in policy order."""
+        labels = self.labels
+        candidates = []
+        by_source = self.index[relation_type.code]
+        if by_source:
+            action_ids = self.matching_ids(action)
+            for source in self.matching_ids(actor):
+                targets = by_source.get(source)
+                if not targets:
+                    continue
+                if len(targets) <= len(action_ids):
+                    for target, entries in targets.items():
+                        if target in action_ids:
+                            candidates.extend(entries)
+                else:
+                    for target in action_ids:
+                        found = targets.get(target)
+                        if found:
+                            candidates.extend(found)
+        candidates.sort(key=itemgetter(0))
+
+        matching = []
+        for _, relation, object_id in candidates:
+            # Check if data_class matches the object field (if present)
+            object_matches = True  # Default to true if no object specified
+            if object_id is not _NO_OBJECT:
+                # If relation has an object field, at least one data_class must match
+                if data_classes:
+                    object_matches = any(
+                        _term_matches(dc, object_id, labels) for dc in data_classes
+                    )
+                else:
+                    # Relation specifies an object but no data_classes provided - no match
+                    object_matches = False
+
+            if object_matches:
+                matching.append(relation)
+        return matching
+
+    def matching_ids(self, value: str) -> FrozenSet[str]:
+        """Return the relation endpoint term IDs that ``value`` matches."""
+        matches = self._matches.get(value)
+        if matches is None:
+            matches = self._scan(value)
+            if len(self._matches) >= _MATCH_CACHE_SIZE:
+                self._matches.clear()
+            self._matches[value] = matches
+        return matches
+
+    def _scan(self, value: str) -> FrozenSet[str]:
+        """Resolve the term IDs matching ``value`` by ID, label or substring."""
+        haystack = self._haystack
+        if haystack is None or type(value) is not str:
+            labels = self.labels
+            return frozenset(
+                term_id for term_id in self.term_ids if _term_matches(value, term_id, labels)
+            )
+        if not value:
+            return frozenset(self.term_ids)
+
+        # An exact ID match is also a substring match, so one pass covers both.
+        found = set(self._label_ids.get(value, ()))
+        if _SEPARATOR not in value:
+            term_ids = self.term_ids
+            starts = self._starts
+            last = len(starts) - 1
+            position = haystack.find(value)
+            while position != -1:
+                i = bisect_right(starts, position) - 1
+                found.add(term_ids[i])
+                if i == last:
+                    break
+                # Skip the rest of this ID; it is already matched.
+                position = haystack.find(value, starts[i + 1])
+        return frozenset(found)
+
+
+def _deny_unless_permitted(permits: List[PolicyRelation], forbids: List[PolicyRelation]) -> bool:
+    return bool(permits) and not forbids
+
+
+def _allow_unless_forbidden(permits: List[PolicyRelation], forbids: List[PolicyRelation]) -> bool:
+    return not forbids
+
+
+# Decision rule per mode, looked up once per evaluation instead of branching.
+_MODE_RULES = {
+    # Deny unless explicitly permitted
+    PolicyMode.STRICT: _deny_unless_permitted,
+    # Allow unless explicitly forbidden
+    PolicyMode.PERMISSIVE: _allow_unless_forbidden,
+    # Additional checks for high-risk operations
+    PolicyMode.PARANOID: _deny_unless_permitted,
+}
+
+
+def _generate_reasoning(
+    decision: bool, permits: List[PolicyRelation], forbids: List[PolicyRelation]
+) -> str:
+    """Generate human-readable reasoning for the decision."""
+    if decision:
+        reasons = []
+        for permit in permits[:3]:  # Show up to 3 reasons
+            if "justification" in permit.metadata:
+                reasons.append(permit.metadata["justification"])
+        if reasons:
+            return f"Permitted: {'; '.join(reasons)}"
+        return f"Permitted by {len(permits)} rule(s), no conflicts"
+    if len(forbids) > 0:
+        reasons = []
+        for forbid in forbids[:3]:  # Show up to 3 reasons
+            if "justification" in forbid.metadata:
+                reasons.append(forbid.metadata["justification"])
+        if reasons:
+            return f"Denied: {'; '.join(reasons)}"
+        return f"Denied by {len(forbids)} prohibition(s)"
+    return "Action not explicitly permitted"
+
+
 class PolicyEngine:
     """Policy engine for evaluating governance decisions.
 
     Maintains the policy graph (terms + relations) and evaluates requests.
+    ``terms`` and ``relations`` are read-only views; change the policy through
+    ``add_term``/``add_relation``/``load_policy`` so that cached derived state
+    is invalidated. Terms and relations are read when the policy is compiled,
+    so do not edit them in place once added.
     """
 
     def __init__(self, mode=PolicyMode.STRICT):
@@ -72,9 +427,11 @@ class PolicyEngine:
                 self.mode = PolicyMode(mode_value)
             else:
                 self.mode = mode_value
-            self.terms: Dict[str, PolicyTerm] = {}
-            self.relations: List[PolicyRelation] = []
-            self._policy_hash: Optional[str] = None
+            self._terms: Dict[str, PolicyTerm] = {}
+            self._relations: List[PolicyRelation] = []
+            self._relations_view: Optional[Tuple[PolicyRelation, ...]] = None
+            self._version = 0
+            self._compiled: Optional[_CompiledPolicy] = None
             # Load the policy
             self.load_policy(policy_dict)
         else:
@@ -85,49 +442,87 @@ class PolicyEngine:
                 self.mode = mode
             else:
                 self.mode = PolicyMode.STRICT
-            self.terms: Dict[str, PolicyTerm] = {}
-            self.relations: List[PolicyRelation] = []
-            self._policy_hash: Optional[str] = None
+            self._terms: Dict[str, PolicyTerm] = {}
+            self._relations: List[PolicyRelation] = []
+            self._relations_view: Optional[Tuple[PolicyRelation, ...]] = None
+            self._version = 0
+            self._compiled: Optional[_CompiledPolicy] = None
+
+    @property
+    def terms(self) -> Mapping[str, PolicyTerm]:
+        """Read-only view of the policy terms, keyed by term ID."""
+        return MappingProxyType(self._terms)
+
+    @property
+    def relations(self) -> Tuple[PolicyRelation, ...]:
+        """The policy relations, in policy order."""
+        view = self._relations_view
+        if view is None:
+            view = self._relations_view = tuple(self._relations)
+        return view
+
+    def _invalidate(self) -> None:
+        """Drop cached state derived from the policy graph."""
+        self._compiled = None
+        self._relations_view = None
+
+    def _compile(self) -> _CompiledPolicy:
+        """Return lookup tables for the current policy, rebuilding them if stale."""
+        compiled = self._compiled
+        if compiled is None or compiled.mode is not self.mode:
+            self._version += 1
+            compiled = self._compiled = _CompiledPolicy(
+                self._version, self.mode, self._terms, self._relations
+            )
+        return compiled
 
     def add_term(self, term: PolicyTerm) -> None:
         """Add a policy term to the engine."""
-        self.terms[term.term_id] = term
-        self._policy_hash = None  # Invalidate cached hash
+        self._terms[term.term_id] = term
+        self._invalidate()
 
     def add_relation(self, relation: PolicyRelation) -> None:
         """Add a policy relation to the engine."""
-        self.relations.append(relation)
-        self._policy_hash = None  # Invalidate cached hash
+        self._relations.append(relation)
+        self._invalidate()
 
     def load_policy(self, policy_data: Dict[str, Any]) -> None:
-        """Load a complete policy from dictionary."""
+        """Load a complete policy from dictionary.
+
+        Both sections are parsed before the current policy is replaced, so a
+        malformed row leaves it untouched. Parsed terms and relations are then
+        added through ``add_term``/``add_relation``.
+        """
+        terms = PolicyTerm.from_dict_many(policy_data.get("terms", []))
+        relations = PolicyRelation.from_dict_many(policy_data.get("relations", []))
+
         # Clear existing policy
-        self.terms.clear()
-        self.relations.clear()
-        self._policy_hash = None
+        self._terms.clear()
+        self._relations.clear()
+        self._invalidate()
 
-        # Load terms
-        for term_data in policy_data.get("terms", []):
-            term = PolicyTerm.from_dict(term_data)
+        for term in terms:
             self.add_term(term)
-
-        # Load relations
-        for relation_data in policy_data.get("relations", []):
-            relation = PolicyRelation.from_dict(relation_data)
+        for relation in relations:
             self.add_relation(relation)
 
+    def get_policy_version(self) -> int:
+        """Get the version number of the current policy.
+
+        The number increases whenever the policy changes and is what decisions
+        are stamped with. Reading it compiles the policy if it changed since the
+        last evaluation; otherwise it is an attribute read. Use
+        ``get_policy_hash`` when a content hash is needed (e.g. for audit
+        records).
+        """
+        return self._compile().version
+
     def get_policy_hash(self) -> str:
         """Get deterministic hash of current policy version.
 
         Uses canonical JSON serialization for stable hashing.
         """
-        if self._policy_hash is not None:
-            return self._policy_hash
-
-        policy_dict = self.to_dict()
-        canonical_json = json.dumps(policy_dict, sort_keys=True, separators=(",", ":"))
-        self._policy_hash = hashlib.sha256(canonical_json.encode()).hexdigest()
-        return self._policy_hash
+        return self._compile().policy_hash.hexdigest()
 
     def evaluate(
         self,
@@ -137,77 +532,46 @@ class PolicyEngine:
         data_classes: Optional[List[str]] = None,
         risk_level: int = 1,
         context: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+    ) -> PolicyDecision:
         """Evaluate a decision request against the policy.
 
         Returns a decision with permitted/denied status and reasoning.
+
+        Decisions depend only on the actor, action, data classes and mode, so
+        they are memoized per policy version; repeated requests are a cache hit.
         """
         if data_classes is None:
             data_classes = []
         if context is None:
             context = {}
 
-        # Find relevant relations
-        permits = self._find_relations(RelationType.PERMITS, actor, action, data_classes)
-        forbids = self._find_relations(RelationType.FORBIDS, actor, action, data_classes)
+        compiled = self._compile()
+        key = (actor, action, tuple(data_classes), self.mode)
+        try:
+            hash(key)
+        except TypeError:
+            return compiled.evaluate(*key)
+        return compiled.decide(*key)
 
-        # Evaluate based on mode
-        if self.mode == PolicyMode.STRICT:
-            # Deny unless explicitly permitted
-            decision = len(permits) > 0 and len(forbids) == 0
-        elif self.mode == PolicyMode.PERMISSIVE:
-            # Allow unless explicitly forbidden
-            decision = len(forbids) == 0
-        else:  # PARANOID
-            # Additional checks for high-risk operations
-            decision = len(permits) > 0 and len(forbids) == 0
-
-        reasoning = self._generate_reasoning(decision, permits, forbids)
-        return PolicyDecision(
-            allowed=decision,
-            reason=reasoning,
-            mode=self.mode.value,
-            permits_count=len(permits),
-            forbids_count=len(forbids),
-            policy_version_hash=self.get_policy_hash(),
-        )
+    def _decide(
+        self, actor: str, action: str, data_classes: Sequence[str], mode: PolicyMode
+    ) -> PolicyDecision:
+        """Evaluate a decision request without consulting the decision cache."""
+        return self._compile().evaluate(actor, action, data_classes, mode)
 
     def _find_relations(
-        self, relation_type: RelationType, actor: str, action: str, data_classes: Optional[List[str]] = None,
+        self,
+        relation_type: RelationType,
+        actor: str,
+        action: str,
+        data_classes: Optional[Sequence[str]] = None,
     ) -> List[PolicyRelation]:
         """Find relations matching the given criteria.
 
         Matches by both term ID and term label/name.
         Also checks data_classes against the relation's object field if present.
         """
-        if data_classes is None:
-            data_classes = []
-
-        matching = []
-        for relation in self.relations:
-            if relation.relation_type != relation_type:
-                continue
-
-            # Check if actor matches the source term
-            actor_matches = self._term_matches(actor, relation.source)
-            # Check if action matches the target term
-            action_matches = self._term_matches(action, relation.target)
-
-            # Check if data_class matches the object field (if present)
-            object_matches = True  # Default to true if no object specified
-            if "object" in relation.metadata:
-                # If relation has an object field, at least one data_class must match
-                if data_classes:
-                    object_matches = any(
-                        self._term_matches(dc, relation.metadata["object"]) for dc in data_classes
-                    )
-                else:
-                    # Relation specifies an object but no data_classes provided - no match
-                    object_matches = False
-
-            if actor_matches and action_matches and object_matches:
-                matching.append(relation)
-        return matching
+        return self._compile().find_relations(relation_type, actor, action, data_classes or ())
 
     def _term_matches(self, value: str, term_id: str) -> bool:
         """Check if a value matches a term by ID or label.
@@ -219,46 +583,20 @@ class PolicyEngine:
         Returns:
             True if value matches the term ID or the term's label
         """
-        # Exact match with term ID
-        if value == term_id:
-            return True
-
-        # Check if the value matches the term's label
-        term = self.terms.get(term_id)
-        if term and term.label == value:
-            return True
-
-        # Substring match for backwards compatibility (e.g., "model" in "actor:model")
-        return value in term_id
+        return _term_matches(value, term_id, self._compile().labels)
 
     def _generate_reasoning(
         self, decision: bool, permits: List[PolicyRelation], forbids: List[PolicyRelation],
     ) -> str:
         """Generate human-readable reasoning for the decision."""
-        if decision:
-            reasons = []
-            for permit in permits[:3]:  # Show up to 3 reasons
-                if "justification" in permit.metadata:
-                    reasons.append(permit.metadata["justification"])
-            if reasons:
-                return f"Permitted: {'; '.join(reasons)}"
-            return f"Permitted by {len(permits)} rule(s), no conflicts"
-        if len(forbids) > 0:
-            reasons = []
-            for forbid in forbids[:3]:  # Show up to 3 reasons
-                if "justification" in forbid.metadata:
-                    reasons.append(forbid.metadata["justification"])
-            if reasons:
-                return f"Denied: {'; '.join(reasons)}"
-            return f"Denied by {len(forbids)} prohibition(s)"
-        return "Action not explicitly permitted"
+        return _generate_reasoning(decision, permits, forbids)
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize policy to dictionary."""
         return {
             "mode": self.mode.value,
-            "terms": [term.to_dict() for term in self.terms.values()],
-            "relations": [relation.to_dict() for relation in self.relations],
+            "terms": [term.to_dict() for term in self._terms.values()],
+            "relations": [relation.to_dict() for relation in self._relations],
         }
 
     @classmethod
@@ -3,13 +3,24 @@
 Relations define permissions, prohibitions, requirements, and other connections between terms.
 """
 
-from dataclasses import dataclass
+import json
+import sys
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union, cast
+
+from lexecon_core._compat import DATACLASS_SLOTS, ViewCacheSlot, orjson, require_msgpack
 
 
 class RelationType(Enum):
-    """Types of policy relations."""
+    """Types of policy relations.
+
+    Each member also has a small integer ``code`` (its declaration index) for
+    use as a cheap lookup key; members hash through a Python-level
+    ``Enum.__hash__``, ints do not. Serialized forms always use ``value``.
+    """
 
     PERMITS = "permits"
     FORBIDS = "forbids"
@@ -17,9 +28,40 @@ class RelationType(Enum):
     IMPLIES = "implies"
     CONFLICTS = "conflicts"
 
+    @classmethod
+    def from_value(cls, value: Any) -> "RelationType":
+        """Return the member with the given value.
+
+        Same result and errors as ``RelationType(value)``, but known values are
+        resolved with a single dict lookup instead of ``Enum.__call__``.
+        """
+        try:
+            return _RELATION_TYPES[value]
+        except (KeyError, TypeError):
+            return cls(value)
+
+    @property
+    def code(self) -> int:
+        """Declaration index of this member."""
+        return _RELATION_TYPE_CODES[self]
+
+
+# Member -> declaration index, behind RelationType.code
+_RELATION_TYPE_CODES: Dict[RelationType, int] = {
+    member: code for code, member in enumerate(RelationType)
+}
+
+# Module-level aliases for the members the factory classmethods use
+_PERMITS = RelationType.PERMITS
+_FORBIDS = RelationType.FORBIDS
+_REQUIRES = RelationType.REQUIRES
+
+# Value -> member lookup for from_dict; misses fall back to RelationType(value)
+_RELATION_TYPES: Dict[str, RelationType] = {member.value: member for member in RelationType}
+
 
-@dataclass
-class PolicyRelation:
+@dataclass(**DATACLASS_SLOTS)
+class PolicyRelation(ViewCacheSlot):
     """A policy relation represents an edge in the policy graph.
 
     Relations connect terms and define the governance rules.
@@ -29,10 +71,13 @@ class PolicyRelation:
     relation_type: RelationType
     source: str  # Source term ID
     target: str  # Target term ID
-    conditions: List[str] = None
-    metadata: Dict[str, Any] = None
+    conditions: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
+        # (field values, dict) behind to_dict_view; rebuilt when any field is reassigned
+        self._view_cache = None
+        # An explicit None (the old default) still means an empty container.
         if self.conditions is None:
             self.conditions = []
         if self.metadata is None:
@@ -41,38 +86,20 @@ class PolicyRelation:
     @classmethod
     def permits(cls, source: str, target: str, conditions: Optional[List[str]] = None) -> "PolicyRelation":
         """Create a permission relation."""
-        relation_id = f"permits:{source}:{target}"
-        return cls(
-            relation_id=relation_id,
-            relation_type=RelationType.PERMITS,
-            source=source,
-            target=target,
-            conditions=conditions or [],
-        )
+        relation_id = sys.intern(f"permits:{source}:{target}")
+        return cls(relation_id, _PERMITS, source, target, conditions or [], {})
 
     @classmethod
     def forbids(cls, source: str, target: str, conditions: Optional[List[str]] = None) -> "PolicyRelation":
         """Create a prohibition relation."""
-        relation_id = f"forbids:{source}:{target}"
-        return cls(
-            relation_id=relation_id,
-            relation_type=RelationType.FORBIDS,
-            source=source,
-            target=target,
-            conditions=conditions or [],
-        )
+        relation_id = sys.intern(f"forbids:{source}:{target}")
+        return cls(relation_id, _FORBIDS, source, target, conditions or [], {})
 
     @classmethod
     def requires(cls, source: str, target: str, conditions: Optional[List[str]] = None) -> "PolicyRelation":
         """Create a requirement relation."""
-        relation_id = f"requires:{source}:{target}"
-        return cls(
-            relation_id=relation_id,
-            relation_type=RelationType.REQUIRES,
-            source=source,
-            target=target,
-            conditions=conditions or [],
-        )
+        relation_id = sys.intern(f"requires:{source}:{target}")
+        return cls(relation_id, _REQUIRES, source, target, conditions or [], {})
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize relation to dictionary."""
@@ -85,6 +112,75 @@ class PolicyRelation:
             "metadata": self.metadata,
         }
 
+    def to_dict_view(self) -> Mapping[str, Any]:
+        """Return a read-only view with the same content as ``to_dict()``.
+
+        The underlying dictionary is built once and reused until a field is
+        reassigned. ``conditions`` and ``metadata`` are shared with the
+        relation, not copied, so in-place edits to them show through the view.
+        """
+        cached = self._view_cache
+        if (
+            cached is None
+            or cached[0] is not self.relation_id
+            or cached[1] is not self.relation_type
+            or cached[2] is not self.source
+            or cached[3] is not self.target
+            or cached[4] is not self.conditions
+            or cached[5] is not self.metadata
+        ):
+            cached = (
+                self.relation_id,
+                self.relation_type,
+                self.source,
+                self.target,
+                self.conditions,
+                self.metadata,
+                self.to_dict(),
+            )
+            self._view_cache = cached
+        return MappingProxyType(cached[6])
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize relation to compact UTF-8 JSON with the same content as ``to_dict()``.
+
+        With orjson installed the dataclass is encoded directly, without
+        building the intermediate dictionary.
+        """
+        if orjson is not None:
+            return cast(bytes, orjson.dumps(self, option=orjson.OPT_NON_STR_KEYS))
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")).encode()
+
+    @classmethod
+    def from_json_bytes(cls, data: Union[bytes, str]) -> "PolicyRelation":
+        """Deserialize relation from JSON, accepting the same formats as ``from_dict``."""
+        return cls.from_dict(orjson.loads(data) if orjson is not None else json.loads(data))
+
+    def to_msgpack(self) -> bytes:
+        """Serialize relation to a compact msgpack payload for inter-process transfer.
+
+        The payload is the positional array ``(relation_id, relation_type, source,
+        target, conditions, metadata)``, with no field names on the wire.
+        Requires the optional ``msgpack`` package.
+        """
+        fields = (
+            self.relation_id,
+            self.relation_type.value,
+            self.source,
+            self.target,
+            self.conditions,
+            self.metadata,
+        )
+        return cast(bytes, require_msgpack().packb(fields))
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "PolicyRelation":
+        """Deserialize relation from a payload produced by ``to_msgpack``."""
+        fields = require_msgpack().unpackb(data, strict_map_key=False)
+        relation_id, relation_type_value, source, target, conditions, metadata = fields
+        relation_type = RelationType.from_value(relation_type_value)
+        return cls(relation_id, relation_type, source, target, conditions, metadata)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PolicyRelation":
         """Deserialize relation from dictionary.
@@ -94,50 +190,93 @@ class PolicyRelation:
         - Simplified: {"type": "permits", "subject": "...", "action": "..."}
         - Three-field: {"type": "permits", "subject": "...", "action": "...", "object": "..."}
         """
+        get = data.get
+
         # Handle relation_type field (can be "type" or "relation_type")
-        relation_type_value = data.get("relation_type") or data.get("type")
+        relation_type_value = get("relation_type") or get("type")
         if not relation_type_value:
             raise ValueError("Missing relation_type or type field")
-        relation_type = RelationType(relation_type_value)
+        try:
+            relation_type = _RELATION_TYPES[relation_type_value]
+        except (KeyError, TypeError):
+            relation_type = RelationType(relation_type_value)
 
         # Handle source field (can be "source" or "subject")
-        source = data.get("source") or data.get("subject")
+        source = get("source") or get("subject")
 
         # Handle target field - more complex logic for three-field format
         # In three-field format: subject -> action -> object
         # We store: source=subject, target=action, and object goes in metadata
-        target = data.get("target") or data.get("action")
+        target = get("target") or get("action")
 
         # For relations without explicit source/target/action, allow just subject or just action
-        if not source and not target:
-            raise ValueError("Missing source/target, subject/action, or subject fields")
-
         # If only one is provided, use it for both (for "requires" relations that may only have action)
-        if not source and target:
+        if not source:
+            if not target:
+                raise ValueError("Missing source/target, subject/action, or subject fields")
             source = target
-        elif source and not target:
+        elif not target:
             target = source
 
-        # Store object field in metadata if present
-        metadata = data.get("metadata", {})
+        # Store object field in metadata if present. The supplied metadata is
+        # copied so these fields are never written into the caller's dict.
+        metadata = get("metadata")
+        metadata = dict(metadata) if metadata else {}
         if "object" in data:
             metadata["object"] = data["object"]
 
         # Store other fields in metadata
-        for field in ["justification", "condition"]:
-            if field in data:
-                metadata[field] = data[field]
-
-        # Generate relation_id if not provided
-        relation_id = data.get("relation_id")
-        if not relation_id:
-            relation_id = f"{relation_type_value}:{source}:{target}"
-
-        return cls(
-            relation_id=relation_id,
-            relation_type=relation_type,
-            source=source,
-            target=target,
-            conditions=data.get("conditions", []),
-            metadata=metadata,
+        if "justification" in data:
+            metadata["justification"] = data["justification"]
+        if "condition" in data:
+            metadata["condition"] = data["condition"]
+
+        # Generate relation_id if not provided (interned, as the same IDs recur across policies)
+        relation_id = get("relation_id") or sys.intern(f"{relation_type_value}:{source}:{target}")
+
+        return cls(relation_id, relation_type, source, target, get("conditions") or [], metadata)
+
+    @classmethod
+    def from_dict_many(cls, rows: Iterable[Dict[str, Any]]) -> List["PolicyRelation"]:
+        """Deserialize a batch of relations, accepting the same formats as ``from_dict``."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
+
+
+# Type code stored for relations whose relation_type is not a RelationType member
+NO_TYPE_CODE = -1
+
+
+class RelationStore:
+    """Column-oriented snapshot of a sequence of relations.
+
+    Sources, targets and type codes are kept in parallel columns, so passes
+    over the graph structure read only those fields instead of touching every
+    relation object. Row ``i`` of each column describes ``relations[i]``.
+
+    The store is a snapshot: relations added to the original list afterwards
+    are not seen, and in-place edits to a relation's endpoints or type are not
+    reflected in the columns.
+    """
+
+    __slots__ = ("relations", "sources", "targets", "type_codes")
+
+    def __init__(self, relations: Iterable[PolicyRelation]):
+        """Initialize the store.
+
+        Args:
+            relations: Relations to snapshot, in policy order.
+        """
+        self.relations = tuple(relations)
+        self.sources = tuple(relation.source for relation in self.relations)
+        self.targets = tuple(relation.target for relation in self.relations)
+        self.type_codes = array(
+            "b",
+            (
+                _RELATION_TYPE_CODES.get(relation.relation_type, NO_TYPE_CODE)
+                for relation in self.relations
+            ),
         )
+
+    def __len__(self) -> int:
+        return len(self.relations)
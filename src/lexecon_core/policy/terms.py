@@ -3,9 +3,14 @@
 Terms represent entities, actions, data classes, and other policy primitives.
 """
 
-from dataclasses import dataclass
+import json
+import re
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Union, cast
+
+from lexecon_core._compat import DATACLASS_SLOTS, ViewCacheSlot, orjson, require_msgpack
 
 
 class TermType(Enum):
@@ -17,9 +22,28 @@ class TermType(Enum):
     RESOURCE = "resource"
     CONTEXT = "context"
 
+    @classmethod
+    def from_value(cls, value: Any) -> "TermType":
+        """Return the member with the given value.
+
+        Same result and errors as ``TermType(value)``, but known values are
+        resolved with a single dict lookup instead of ``Enum.__call__``.
+        """
+        try:
+            return _TERM_TYPES[value]
+        except (KeyError, TypeError):
+            return cls(value)
+
+
+# Well-formed term IDs: a known prefix, a colon and a non-empty ASCII word
+_TERM_ID_MATCH = re.compile(r"(?:action|actor|data|resource|context):[A-Za-z0-9_]+").fullmatch
 
-@dataclass
-class PolicyTerm:
+# Value -> member lookup for from_dict; misses fall back to TermType(value)
+_TERM_TYPES: Dict[str, TermType] = {member.value: member for member in TermType}
+
+
+@dataclass(**DATACLASS_SLOTS)
+class PolicyTerm(ViewCacheSlot):
     """A policy term represents a node in the policy graph.
 
     Terms can represent actions, actors, data classes, resources, or contexts.
@@ -29,51 +53,45 @@ class PolicyTerm:
     term_type: TermType
     label: str
     description: str
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
+        # (field values, dict) behind to_dict_view; rebuilt when any field is reassigned
+        self._view_cache = None
+        # An explicit None (the old default) still means an empty dict.
         if self.metadata is None:
             self.metadata = {}
 
+    @staticmethod
+    def validate_id(term_id: Any) -> bool:
+        """Check that ``term_id`` has the canonical ``<prefix>:<name>`` shape.
+
+        The prefix is one of ``action``, ``actor``, ``data``, ``resource`` or
+        ``context`` and the name uses only ASCII letters, digits and
+        underscores. IDs are not validated on construction; this is for callers
+        that want to enforce the convention.
+        """
+        return type(term_id) is str and _TERM_ID_MATCH(term_id) is not None
+
     @classmethod
     def create_action(cls, term_id: str, label: str, description: str = "") -> "PolicyTerm":
         """Create an action term."""
-        return cls(
-            term_id=f"action:{term_id}",
-            term_type=TermType.ACTION,
-            label=label,
-            description=description,
-        )
+        return cls(f"action:{term_id}", TermType.ACTION, label, description, {})
 
     @classmethod
     def create_actor(cls, term_id: str, label: str, description: str = "") -> "PolicyTerm":
         """Create an actor term."""
-        return cls(
-            term_id=f"actor:{term_id}",
-            term_type=TermType.ACTOR,
-            label=label,
-            description=description,
-        )
+        return cls(f"actor:{term_id}", TermType.ACTOR, label, description, {})
 
     @classmethod
     def create_data_class(cls, term_id: str, label: str, description: str = "") -> "PolicyTerm":
         """Create a data class term."""
-        return cls(
-            term_id=f"data:{term_id}",
-            term_type=TermType.DATA_CLASS,
-            label=label,
-            description=description,
-        )
+        return cls(f"data:{term_id}", TermType.DATA_CLASS, label, description, {})
 
     @classmethod
     def create_resource(cls, term_id: str, label: str, description: str = "") -> "PolicyTerm":
         """Create a resource term."""
-        return cls(
-            term_id=f"resource:{term_id}",
-            term_type=TermType.RESOURCE,
-            label=label,
-            description=description,
-        )
+        return cls(f"resource:{term_id}", TermType.RESOURCE, label, description, {})
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize term to dictionary."""
@@ -85,6 +103,65 @@ class PolicyTerm:
             "metadata": self.metadata,
         }
 
+    def to_dict_view(self) -> Mapping[str, Any]:
+        """Return a read-only view with the same content as ``to_dict()``.
+
+        The underlying dictionary is built once and reused until a field is
+        reassigned. ``metadata`` is shared with the term, not copied, so
+        in-place edits to it show through the view.
+        """
+        cached = self._view_cache
+        if (
+            cached is None
+            or cached[0] is not self.term_id
+            or cached[1] is not self.term_type
+            or cached[2] is not self.label
+            or cached[3] is not self.description
+            or cached[4] is not self.metadata
+        ):
+            cached = (
+                self.term_id,
+                self.term_type,
+                self.label,
+                self.description,
+                self.metadata,
+                self.to_dict(),
+            )
+            self._view_cache = cached
+        return MappingProxyType(cached[5])
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize term to compact UTF-8 JSON with the same content as ``to_dict()``.
+
+        With orjson installed the dataclass is encoded directly, without
+        building the intermediate dictionary.
+        """
+        if orjson is not None:
+            return cast(bytes, orjson.dumps(self, option=orjson.OPT_NON_STR_KEYS))
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")).encode()
+
+    @classmethod
+    def from_json_bytes(cls, data: Union[bytes, str]) -> "PolicyTerm":
+        """Deserialize term from JSON, accepting the same formats as ``from_dict``."""
+        return cls.from_dict(orjson.loads(data) if orjson is not None else json.loads(data))
+
+    def to_msgpack(self) -> bytes:
+        """Serialize term to a compact msgpack payload for inter-process transfer.
+
+        The payload is the positional array ``(term_id, term_type, label,
+        description, metadata)``, with no field names on the wire. Requires the
+        optional ``msgpack`` package.
+        """
+        fields = (self.term_id, self.term_type.value, self.label, self.description, self.metadata)
+        return cast(bytes, require_msgpack().packb(fields))
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "PolicyTerm":
+        """Deserialize term from a payload produced by ``to_msgpack``."""
+        fields = require_msgpack().unpackb(data, strict_map_key=False)
+        term_id, term_type_value, label, description, metadata = fields
+        return cls(term_id, TermType.from_value(term_type_value), label, description, metadata)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PolicyTerm":
         """Deserialize term from dictionary.
@@ -93,27 +170,29 @@ class PolicyTerm:
         - Full: {"term_id": "...", "term_type": "...", "label": "...", "description": "..."}
         - Simplified: {"id": "...", "type": "...", "name": "..."}
         """
+        get = data.get
+
         # Handle term_id field (can be "term_id" or "id")
-        term_id = data.get("term_id") or data.get("id")
+        term_id = get("term_id") or get("id")
         if not term_id:
             raise ValueError("Missing term_id or id field")
 
         # Handle term_type field (can be "term_type" or "type")
-        term_type_value = data.get("term_type") or data.get("type")
+        term_type_value = get("term_type") or get("type")
         if not term_type_value:
             raise ValueError("Missing term_type or type field")
-        term_type = TermType(term_type_value)
+        try:
+            term_type = _TERM_TYPES[term_type_value]
+        except (KeyError, TypeError):
+            term_type = TermType(term_type_value)
 
-        # Handle label field (can be "label" or "name")
-        label = data.get("label") or data.get("name", "")
+        # Handle label field (can be "label" or "name"); description is optional
+        label = get("label") or get("name", "")
 
-        # Description is optional
-        description = data.get("description", "")
+        return cls(term_id, term_type, label, get("description", ""), get("metadata") or {})
 
-        return cls(
-            term_id=term_id,
-            term_type=term_type,
-            label=label,
-            description=description,
-            metadata=data.get("metadata", {}),
-        )
+    @classmethod
+    def from_dict_many(cls, rows: Iterable[Dict[str, Any]]) -> List["PolicyTerm"]:
+        """Deserialize a batch of terms, accepting the same formats as ``from_dict``."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -0,0 +1,83 @@
+"""Tests for the core HTTP API."""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from lexecon_core.api import server
+from lexecon_core.ledger.chain import LedgerChain
+
+
+class MemoryStorage:
+    """Storage backend that records entries."""
+
+    def __init__(self):
+        self.entries = []
+        self.lock = threading.Lock()
+
+    def save_entry(self, entry):
+        with self.lock:
+            self.entries.append(entry)
+
+    def load_all_entries(self):
+        return list(self.entries)
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(server, "policy_engine", None)
+    monkeypatch.setattr(server, "ledger", LedgerChain())
+
+
+def test_decide_applies_the_sample_policy():
+    with TestClient(server.app) as client:
+        allowed = client.post("/decide", json={"actor": "ai_agent", "action": "access_data"})
+        denied = client.post("/decide", json={"actor": "ai_agent", "action": "delete_data"})
+
+    assert allowed.status_code == 200
+    assert allowed.json()["decision"] == "allow"
+    assert denied.status_code == 200
+    assert denied.json()["decision"] == "deny"
+    assert [entry.data["decision"] for entry in server.ledger.entries[1:]] == ["allow", "deny"]
+
+
+def test_initialize_is_idempotent():
+    server.initialize()
+    engine = server.policy_engine
+    relations = engine.relations
+
+    server.initialize()
+
+    assert server.policy_engine is engine
+    assert engine.relations == relations
+    assert len(relations) == 1
+
+
+def test_configure_ledger_flushes_queued_writes_on_shutdown():
+    storage = MemoryStorage()
+    with TestClient(server.app) as client:
+        ledger = server.configure_ledger(storage)
+        for _ in range(20):
+            response = client.post("/decide", json={"actor": "ai_agent", "action": "access_data"})
+            assert response.status_code == 200
+
+    assert [entry.entry_hash for entry in storage.entries] == [
+        entry.entry_hash for entry in ledger.entries
+    ]
+    assert len(storage.entries) == 21
+
+
+def test_list_entries_returns_the_last_matching_entries():
+    server.ledger.append("note", {"i": -1})
+    for i in range(5):
+        server.ledger.append("decision", {"i": i})
+        server.ledger.append("note", {"i": i})
+
+    with TestClient(server.app) as client:
+        decisions = client.get("/ledger/entries", params={"event_type": "decision", "limit": 2})
+        tail = client.get("/ledger/entries", params={"limit": 3})
+
+    assert [entry["data"]["i"] for entry in decisions.json()["entries"]] == [3, 4]
+    assert [entry["event_type"] for entry in tail.json()["entries"]] == ["note", "decision", "note"]
+    assert decisions.json()["total"] == len(server.ledger.entries)
@@ -0,0 +1,120 @@
+"""Tests for canonical JSON encoding."""
+
+import datetime
+import enum
+import json
+import random
+import uuid
+
+import pytest
+
+from lexecon_core import canonical
+from lexecon_core.canonical import canonical_json
+
+ENCODERS = ["orjson", "stdlib"]
+
+
+@pytest.fixture(params=ENCODERS)
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        if canonical.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(canonical, "orjson", None)
+    return request.param
+
+
+def _reference(obj):
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+
+_STRINGS = [
+    "", "a", "actor:model", "é", "日本", "\x7f", "\x00", '"', "\\", "\n", "null", "1e5", "😀"
+]
+_FLOATS = [0.0, -0.0, 1.5, 0.1, 1e16, 1e-5, 1e-7, 123456789.125, 1e300, float("inf"), float("nan")]
+
+
+def _random_value(rng, depth=0):
+    kind = rng.randrange(8 if depth < 3 else 5)
+    if kind == 0:
+        return rng.choice(_STRINGS) + str(rng.randrange(100))
+    if kind == 1:
+        return rng.choice([rng.randrange(-1000, 1000), 2**63, -(2**64), 10**30])
+    if kind == 2:
+        return rng.choice(_FLOATS) * rng.choice([1, -1, 3.7])
+    if kind == 3:
+        return rng.choice([True, False, None])
+    if kind == 4:
+        return rng.choice(_STRINGS)
+    if kind == 5:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    if kind == 6:
+        return tuple(_random_value(rng, depth + 1) for _ in range(rng.randrange(3)))
+    keys = [rng.choice(_STRINGS) + str(i) for i in range(rng.randrange(4))]
+    return {key: _random_value(rng, depth + 1) for key in keys}
+
+
+def test_matches_stdlib_on_random_documents(encoder):
+    rng = random.Random(0)
+    for _ in range(2000):
+        obj = _random_value(rng)
+        assert canonical_json(obj) == _reference(obj), obj
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"b": 1, "a": [1, 2, {"d": None, "c": True}]},
+        "plain string",
+        {2: "int key", 1: "other int key"},
+        {"unicode": "café ☃ \U0001f600"},
+        [1e16, 1e-05, 0.1, 2.5e-8, -0.0],
+    ],
+)
+def test_matches_stdlib_on_known_documents(encoder, obj):
+    assert canonical_json(obj) == _reference(obj)
+
+
+class Colour(enum.Enum):
+    RED = "red"
+    BLUE = 2
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+
+
+def test_enum_and_uuid_encode_the_same_on_both_paths(encoder):
+    request_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    obj = {"colour": Colour.RED, "other": Colour.BLUE, "level": Level.LOW, "id": request_id}
+
+    assert canonical_json(obj) == _reference(
+        {"colour": "red", "other": 2, "level": 1, "id": str(request_id)}
+    )
+
+
+@pytest.mark.parametrize("obj", [datetime.datetime(2024, 1, 1), object(), {1, 2}])
+def test_unsupported_types_raise_on_both_paths(encoder, obj):
+    with pytest.raises(TypeError):
+        canonical_json({"value": obj})
+
+
+@pytest.mark.parametrize(
+    "obj, fast",
+    [
+        ([1.23456789, 0.0001234, 123456.5, 100.00001], True),
+        ({"e5": "10e5", "x": 1}, False),
+        ([1e16], False),
+        ([1e-05], False),
+        ([-2.5e-7], False),
+        ([1, None], False),
+        ([float("nan")], False),
+    ],
+)
+def test_fast_path_only_rejects_mismatching_forms(obj, fast):
+    if canonical.orjson is None:
+        pytest.skip("orjson not installed")
+    encoded = canonical.orjson.dumps(obj, option=canonical._ORJSON_OPTIONS)
+
+    assert canonical._matches_stdlib(encoded) is fast
+    assert canonical_json(obj) == _reference(obj)
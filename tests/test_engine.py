@@ -0,0 +1,250 @@
+"""Tests for policy evaluation."""
+
+import copy
+import dataclasses
+import gc
+import json
+import pickle
+import random
+import weakref
+
+import pytest
+
+from lexecon_core.policy.engine import (
+    _DECISION_KEYS,
+    PolicyDecision,
+    PolicyEngine,
+    PolicyMode,
+    _CompiledPolicy,
+)
+from lexecon_core.policy.relations import PolicyRelation, RelationType
+from lexecon_core.policy.terms import PolicyTerm, TermType
+
+
+def test_relations_without_metadata_or_conditions_evaluate():
+    engine = PolicyEngine(mode=PolicyMode.STRICT)
+    engine.add_term(PolicyTerm.create_actor("model", "AI Model"))
+    engine.add_term(PolicyTerm.create_action("read", "Read"))
+    relation = PolicyRelation(
+        "permits:model:read", RelationType.PERMITS, "actor:model", "action:read", None, None
+    )
+    engine.add_relation(relation)
+
+    decision = engine.evaluate("model", "read")
+
+    assert decision.allowed
+    assert decision.permits_count == 1
+    assert len(engine.get_policy_hash()) == 64
+
+
+def _engine():
+    engine = PolicyEngine(mode=PolicyMode.STRICT)
+    engine.add_term(PolicyTerm.create_actor("model", "AI Model"))
+    engine.add_term(PolicyTerm.create_action("read", "Read"))
+    engine.add_relation(PolicyRelation.permits("actor:model", "action:read"))
+    return engine
+
+
+def test_decisions_pickle_with_their_policy_hash():
+    engine = _engine()
+    decision = engine.evaluate("model", "read")
+
+    restored = pickle.loads(pickle.dumps(decision))
+
+    assert restored == decision
+    assert restored.policy_version_hash == engine.get_policy_hash()
+
+
+def test_decisions_do_not_reference_the_compiled_policy():
+    engine = _engine()
+    decision = engine.evaluate("model", "read")
+    policy_hash = engine.get_policy_hash()
+
+    engine.add_relation(PolicyRelation.forbids("actor:model", "action:read"))
+
+    referents = gc.get_referents(decision._policy)
+    assert not any(isinstance(referent, _CompiledPolicy) for referent in referents)
+    assert decision.policy_version_hash == policy_hash != engine.get_policy_hash()
+
+
+def test_decision_fields_are_the_documented_keys():
+    engine = _engine()
+    decision = engine.evaluate("model", "read")
+
+    as_dict = dataclasses.asdict(decision)
+
+    assert set(as_dict) == {f.name for f in dataclasses.fields(decision)}
+    assert set(as_dict) <= _DECISION_KEYS
+    assert json.loads(json.dumps(as_dict))["allowed"] is True
+    assert copy.deepcopy(decision).policy_version_hash == engine.get_policy_hash()
+    assert PolicyDecision(True, "ok").policy_version_hash == ""
+
+
+def _reference_find(engine, relation_type, actor, action, data_classes):
+    """The original linear scan: every relation, every endpoint, via _term_matches."""
+    labels = {term_id: term.label for term_id, term in engine.terms.items()}
+
+    def matches(value, term_id):
+        return value == term_id or labels.get(term_id) == value or value in term_id
+
+    found = []
+    for relation in engine.relations:
+        if relation.relation_type != relation_type:
+            continue
+        if "object" in relation.metadata:
+            object_matches = any(matches(dc, relation.metadata["object"]) for dc in data_classes)
+        else:
+            object_matches = True
+        if matches(actor, relation.source) and matches(action, relation.target) and object_matches:
+            found.append(relation)
+    return found
+
+
+_IDS = [
+    "actor:model",
+    "actor:model_v2",
+    "actor:human",
+    "action:read",
+    "action:read_all",
+    "action:write",
+    "data:pii",
+    "data:public",
+    "resource:db",
+    "",
+    "odd\0id",
+]
+_LABELS = ["AI Model", "Human", "Read", "Write", "PII", "model", "read"]
+
+
+def _random_engine(rng):
+    engine = PolicyEngine(mode=rng.choice(list(PolicyMode)))
+    for term_id in rng.sample(_IDS, rng.randrange(len(_IDS))):
+        term_type = rng.choice(list(TermType))
+        engine.add_term(PolicyTerm(term_id, term_type, rng.choice(_LABELS), "", {}))
+    for i in range(rng.randrange(12)):
+        metadata = {}
+        if rng.random() < 0.3:
+            metadata["object"] = rng.choice(_IDS)
+        if rng.random() < 0.3:
+            metadata["justification"] = f"rule {i}"
+        relation_type = rng.choice(
+            [RelationType.PERMITS, RelationType.FORBIDS, RelationType.REQUIRES]
+        )
+        source, target = rng.choice(_IDS), rng.choice(_IDS)
+        relation = PolicyRelation(f"r{i}", relation_type, source, target, [], metadata or None)
+        engine.add_relation(relation)
+    return engine
+
+
+def _random_value(rng):
+    value = rng.choice(_IDS + _LABELS + ["unknown", "a", "o", ":", "\0"])
+    if value and rng.random() < 0.3:
+        start = rng.randrange(len(value))
+        value = value[start : rng.randrange(start, len(value) + 1)]
+    return value
+
+
+def test_decisions_match_the_linear_reference():
+    rng = random.Random(0)
+    for _ in range(300):
+        engine = _random_engine(rng)
+        for _ in range(20):
+            actor, action = _random_value(rng), _random_value(rng)
+            data_classes = [_random_value(rng) for _ in range(rng.randrange(3))]
+            permits = _reference_find(engine, RelationType.PERMITS, actor, action, data_classes)
+            forbids = _reference_find(engine, RelationType.FORBIDS, actor, action, data_classes)
+            if engine.mode is PolicyMode.PERMISSIVE:
+                allowed = not forbids
+            else:
+                allowed = bool(permits) and not forbids
+
+            for _ in range(2):  # second call is served from the decision cache
+                decision = engine.evaluate(actor, action, data_classes=data_classes)
+                assert decision.allowed == allowed, (actor, action, data_classes)
+                assert decision.permits_count == len(permits)
+                assert decision.forbids_count == len(forbids)
+                assert decision.reason == engine._generate_reasoning(allowed, permits, forbids)
+
+
+def test_policy_containers_cannot_be_edited_behind_the_engine():
+    engine = _engine()
+    assert engine.evaluate("actor:model", "action:read").allowed
+
+    with pytest.raises(TypeError):
+        engine.relations[0] = PolicyRelation.forbids("actor:model", "action:read")
+    with pytest.raises(TypeError):
+        engine.terms["actor:model"] = PolicyTerm.create_actor("model", "Renamed")
+
+    assert engine.evaluate("actor:model", "action:read").allowed
+
+
+def test_replacing_a_term_or_adding_a_relation_takes_effect():
+    engine = _engine()
+    assert engine.evaluate("AI Model", "read").allowed
+    version = engine.get_policy_version()
+
+    engine.add_term(PolicyTerm.create_actor("model", "Assistant"))
+    assert not engine.evaluate("AI Model", "read").allowed
+    assert engine.evaluate("Assistant", "read").allowed
+
+    engine.add_relation(PolicyRelation.forbids("actor:model", "action:read"))
+    assert not engine.evaluate("Assistant", "read").allowed
+    assert engine.get_policy_version() > version
+
+
+def test_changing_the_mode_recompiles_the_policy():
+    engine = _engine()
+    policy_hash = engine.get_policy_hash()
+
+    engine.mode = PolicyMode.PERMISSIVE
+
+    assert engine.evaluate("nobody", "nothing").allowed
+    assert engine.get_policy_hash() != policy_hash
+
+
+def test_load_policy_adds_through_the_engine_hooks():
+    added = []
+
+    class AuditedEngine(PolicyEngine):
+        def add_term(self, term):
+            added.append(term.term_id)
+            super().add_term(term)
+
+        def add_relation(self, relation):
+            added.append(relation.relation_id)
+            super().add_relation(relation)
+
+    engine = AuditedEngine(mode=PolicyMode.STRICT)
+    engine.load_policy(_engine().to_dict())
+
+    assert added == ["actor:model", "action:read", "permits:actor:model:action:read"]
+    assert engine.evaluate("model", "read").allowed
+
+
+def test_load_policy_keeps_the_current_policy_when_a_row_is_malformed():
+    engine = _engine()
+    policy = engine.to_dict()
+    policy["relations"].append({"type": "not-a-relation-type"})
+
+    with pytest.raises(ValueError):
+        engine.load_policy(policy)
+
+    assert len(engine.relations) == 1
+    assert engine.evaluate("model", "read").allowed
+
+
+def test_superseded_policies_are_freed_without_the_cycle_collector():
+    engine = _engine()
+    engine.evaluate("model", "read")
+    compiled = weakref.ref(engine._compiled)
+    owner = weakref.ref(engine)
+
+    gc.disable()
+    try:
+        engine.add_relation(PolicyRelation.forbids("actor:model", "action:read"))
+        assert compiled() is None
+        engine.evaluate("model", "read")
+        del engine
+        assert owner() is None
+    finally:
+        gc.enable()
@@ -0,0 +1,86 @@
+"""Tests for the tamper-evident ledger chain."""
+
+import dataclasses
+
+import pytest
+
+from lexecon_core.ledger.chain import _VERIFY_CHUNK_SIZE, LedgerChain
+
+
+def _chain(length: int = 5) -> LedgerChain:
+    ledger = LedgerChain()
+    for i in range(length):
+        ledger.append("decision", {"i": i, "actor": "actor:model"})
+    return ledger
+
+
+def test_exported_entries_do_not_alias_the_ledger():
+    ledger = _chain()
+    original_hash = ledger.entries[1].entry_hash
+
+    exported = ledger.to_dict()
+    exported["entries"][1]["entry_hash"] = "0" * 64
+    with pytest.raises(ValueError):
+        LedgerChain.from_dict(exported)
+
+    assert ledger.entries[1].to_dict()["entry_hash"] == original_hash
+    assert ledger.to_dict()["entries"][1]["entry_hash"] == original_hash
+    assert ledger.verify_integrity()["valid"]
+
+
+def test_cached_dict_is_not_a_field():
+    entry = _chain().entries[1]
+    entry.to_dict()
+
+    assert dataclasses.asdict(entry) == entry.to_dict()
+    assert "_dict" not in repr(entry)
+    assert entry == dataclasses.replace(entry)
+
+
+def test_verify_detects_fields_rewritten_behind_the_frozen_dataclass():
+    ledger = _chain()
+    object.__setattr__(ledger.entries[2], "timestamp", "1999-01-01T00:00:00")
+
+    result = ledger.verify_integrity()
+
+    assert not result["valid"]
+    assert result["error"] == "Hash mismatch at entry 2"
+
+
+def test_verify_detects_in_place_data_edits():
+    ledger = _chain()
+    ledger.entries[3].data["i"] = 999
+
+    result = ledger.verify_integrity()
+
+    assert not result["valid"]
+    assert result["entries_verified"] == 3
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 3])
+def test_parallel_verify_matches_serial(max_workers):
+    ledger = _chain(2 * _VERIFY_CHUNK_SIZE + 17)
+
+    assert ledger.verify_integrity(parallel=True, max_workers=max_workers) == (
+        ledger.verify_integrity()
+    )
+
+
+@pytest.mark.parametrize("index", [1, _VERIFY_CHUNK_SIZE, 2 * _VERIFY_CHUNK_SIZE + 10])
+def test_parallel_verify_reports_the_same_tampering_as_serial(index):
+    ledger = _chain(2 * _VERIFY_CHUNK_SIZE + 17)
+    ledger.entries[index].data["i"] = -1
+    serial = ledger.verify_integrity()
+
+    parallel = ledger.verify_integrity(parallel=True, max_workers=4)
+
+    assert parallel == serial
+    assert parallel["error"] == f"Hash mismatch at entry {index}"
+
+
+def test_parallel_verify_detects_broken_links():
+    ledger = _chain(_VERIFY_CHUNK_SIZE + 5)
+    del ledger.entries[_VERIFY_CHUNK_SIZE]
+
+    assert ledger.verify_integrity(parallel=True) == ledger.verify_integrity()
+    assert not ledger.verify_integrity(parallel=True)["valid"]
@@ -0,0 +1,67 @@
+"""Tests for policy term and relation serialization."""
+
+import dataclasses
+import json
+
+import pytest
+
+from lexecon_core.policy.relations import NO_TYPE_CODE, PolicyRelation, RelationStore, RelationType
+from lexecon_core.policy.terms import PolicyTerm, TermType
+
+
+def test_none_containers_serialize_as_empty():
+    relation = PolicyRelation("r", RelationType.FORBIDS, "actor:a", "action:b", None, None)
+    term = PolicyTerm("actor:a", TermType.ACTOR, "A", "", None)
+
+    assert relation.to_dict()["conditions"] == []
+    assert relation.to_dict()["metadata"] == {}
+    assert json.loads(relation.to_json_bytes()) == relation.to_dict()
+    assert PolicyRelation.from_json_bytes(relation.to_json_bytes()).metadata == {}
+    assert term.to_dict()["metadata"] == {}
+    assert json.loads(term.to_json_bytes()) == term.to_dict()
+
+
+def test_none_containers_are_normalized_at_construction():
+    relation = PolicyRelation("r", RelationType.FORBIDS, "actor:a", "action:b", None, None)
+    term = PolicyTerm("actor:a", TermType.ACTOR, "A", "", None)
+
+    relation.conditions.append("c")
+    relation.metadata["object"] = "data:x"
+    term.metadata["k"] = "v"
+
+    assert relation.to_dict()["conditions"] == ["c"]
+    assert relation.to_dict()["metadata"] == {"object": "data:x"}
+    assert term.to_dict()["metadata"] == {"k": "v"}
+
+
+def test_none_containers_round_trip_through_msgpack():
+    pytest.importorskip("msgpack")
+    relation = PolicyRelation("r", RelationType.FORBIDS, "actor:a", "action:b", None, None)
+    term = PolicyTerm("actor:a", TermType.ACTOR, "A", "", None)
+
+    assert PolicyRelation.from_msgpack(relation.to_msgpack()).to_dict() == relation.to_dict()
+    assert PolicyTerm.from_msgpack(term.to_msgpack()).to_dict() == term.to_dict()
+
+
+def test_view_cache_is_not_a_field():
+    relation = PolicyRelation.permits("actor:a", "action:b")
+    term = PolicyTerm.create_actor("a", "A")
+    relation.to_dict_view()
+    term.to_dict_view()
+
+    assert "_view_cache" not in dataclasses.asdict(relation)
+    assert "_view_cache" not in dataclasses.asdict(term)
+    assert "_view_cache" not in {f.name for f in dataclasses.fields(relation)}
+    assert "_view_cache" not in {f.name for f in dataclasses.fields(term)}
+    assert "_view_cache" not in repr(relation) and "_view_cache" not in repr(term)
+    assert json.loads(relation.to_json_bytes()) == relation.to_dict()
+    assert json.loads(term.to_json_bytes()) == term.to_dict()
+
+
+def test_type_codes_are_declaration_indexes():
+    relations = [PolicyRelation(member.value, member, "actor:a", "action:b") for member in RelationType]
+    relations.append(PolicyRelation("raw", "permits", "actor:a", "action:b"))
+    store = RelationStore(relations)
+
+    assert [member.code for member in RelationType] == list(range(len(RelationType)))
+    assert list(store.type_codes) == [member.code for member in RelationType] + [NO_TYPE_CODE]
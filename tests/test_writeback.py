@@ -0,0 +1,175 @@
+"""Tests for batched write-back ledger storage."""
+
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+import lexecon_core
+from lexecon_core.ledger.chain import LedgerChain
+from lexecon_core.ledger.writeback import WriteBackStorage
+
+
+class MemoryStorage:
+    """Storage backend that records entries and can be told to fail."""
+
+    def __init__(self, failures: int = 0):
+        self.entries = []
+        self.failures = failures
+        self.lock = threading.Lock()
+
+    def save_entry(self, entry):
+        with self.lock:
+            if self.failures:
+                self.failures -= 1
+                raise OSError("disk full")
+            self.entries.append(entry)
+
+    def load_all_entries(self):
+        return list(self.entries)
+
+
+class BatchStorage(MemoryStorage):
+    def __init__(self, failures: int = 0):
+        super().__init__(failures)
+        self.batches = []
+
+    def save_entries(self, entries):
+        with self.lock:
+            if self.failures:
+                self.failures -= 1
+                raise OSError("disk full")
+            self.batches.append(list(entries))
+            self.entries.extend(entries)
+
+
+def _ids(entries):
+    return [entry.entry_id for entry in entries]
+
+
+def test_flush_persists_every_entry_in_order():
+    storage = MemoryStorage()
+    writeback = WriteBackStorage(storage)
+    ledger = LedgerChain(storage=writeback)
+    for i in range(50):
+        ledger.append("decision", {"i": i})
+
+    writeback.flush()
+
+    assert _ids(storage.entries) == _ids(ledger.entries)
+    writeback.close()
+
+
+def test_batches_respect_max_batch():
+    storage = BatchStorage()
+    writeback = WriteBackStorage(storage, max_batch=4)
+    ledger = LedgerChain(storage=writeback)
+    for i in range(20):
+        ledger.append("decision", {"i": i})
+
+    writeback.close()
+
+    assert all(len(batch) <= 4 for batch in storage.batches)
+    assert _ids(storage.entries) == _ids(ledger.entries)
+
+
+@pytest.mark.parametrize("storage_cls", [MemoryStorage, BatchStorage])
+def test_failed_write_is_retried_and_raised_once(storage_cls):
+    storage = storage_cls()
+    writeback = WriteBackStorage(storage, retry_delay=0.2)
+    ledger = LedgerChain(storage=writeback)
+    writeback.flush()  # genesis
+    storage.failures = 1
+    for i in range(10):
+        ledger.append("decision", {"i": i})
+
+    with pytest.raises(OSError, match="disk full"):
+        writeback.flush()
+    # Appends keep working after a failure; the error is not re-raised.
+    ledger.append("decision", {"i": 10})
+    writeback.flush()
+    writeback.close()
+
+    assert _ids(storage.entries) == _ids(ledger.entries)
+
+
+def test_failure_is_reported_after_a_successful_retry():
+    storage = MemoryStorage()
+    writeback = WriteBackStorage(storage, retry_delay=0.01)
+    ledger = LedgerChain(storage=writeback)
+    writeback.flush()
+    storage.failures = 1
+    ledger.append("decision", {"i": 0})
+    deadline = time.monotonic() + 5
+    while len(storage.entries) < len(ledger.entries) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    with pytest.raises(OSError, match="disk full"):
+        writeback.flush()
+    writeback.close()
+
+    assert _ids(storage.entries) == _ids(ledger.entries)
+
+
+def test_queued_entries_are_written_at_interpreter_exit(tmp_path):
+    path = tmp_path / "entries.txt"
+    script = textwrap.dedent(
+        f"""
+        import time
+
+        from lexecon_core.ledger.chain import LedgerChain
+        from lexecon_core.ledger.writeback import WriteBackStorage
+
+        class SlowStorage:
+            def save_entry(self, entry):
+                time.sleep(0.005)
+                with open({str(path)!r}, "a") as f:
+                    f.write(entry.entry_id + "\\n")
+
+            def load_all_entries(self):
+                return []
+
+        ledger = LedgerChain(storage=WriteBackStorage(SlowStorage()))
+        for i in range(50):
+            ledger.append("decision", {{"i": i}})
+        """
+    )
+    src = os.path.dirname(os.path.dirname(lexecon_core.__file__))
+    subprocess.run([sys.executable, "-c", script], check=True, env=dict(os.environ, PYTHONPATH=src))
+
+    assert len(path.read_text().splitlines()) == 51
+
+
+def test_close_raises_and_keeps_entries_queued():
+    storage = MemoryStorage()
+    writeback = WriteBackStorage(storage, retry_delay=60)
+    ledger = LedgerChain(storage=writeback)
+    writeback.flush()
+    storage.failures = 100
+    for i in range(5):
+        ledger.append("decision", {"i": i})
+
+    with pytest.raises(OSError):
+        writeback.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        writeback.save_entry(ledger.entries[-1])
+
+    storage.failures = 0
+    writeback.close()
+
+    assert _ids(storage.entries) == _ids(ledger.entries)
+
+
+def test_load_all_entries_waits_for_pending_writes():
+    storage = MemoryStorage()
+    writeback = WriteBackStorage(storage)
+    ledger = LedgerChain(storage=writeback)
+    for i in range(10):
+        ledger.append("decision", {"i": i})
+
+    assert _ids(writeback.load_all_entries()) == _ids(ledger.entries)
+    writeback.close()